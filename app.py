@@ -1,21 +1,53 @@
 import os
+from dotenv import load_dotenv
 from flask import Flask, render_template, request, session
 
 # --- Importation des composants de l'architecture ---
 # Cette section montre clairement les dépendances de la couche web envers la couche application.
 from src.application.chat_service import ChatService
+from src.application.deadline import Deadline, DeadlineExceeded
 from src.infrastructure.ai_client_factory import AIClientFactory
 from src.infrastructure.pdf_processor import PyMuPDFProcessor
+from src.infrastructure.replay_client import ReplayMissError
 from src.domaine.conversation import Conversation
 from src.domaine.message import Message
 
 # --- Configuration ---
+load_dotenv()
 app = Flask(__name__)
-app.secret_key = os.urandom(24)  # Clé secrète pour sécuriser les sessions Flask
+# Clé secrète pour sécuriser les sessions Flask. Elle doit être stable et partagée
+# par tous les workers, sinon chaque redémarrage invalide les sessions.
+app.secret_key = os.getenv("FLASK_SECRET_KEY")
+if not app.secret_key:
+    print("ATTENTION : FLASK_SECRET_KEY n'est pas définie, une clé éphémère est utilisée.")
+    app.secret_key = os.urandom(24)
 
 # Instanciation des composants qui n'ont pas d'état de requête (stateless)
 pdf_processor = PyMuPDFProcessor()
-available_providers = list(AIClientFactory._clients.keys())
+# Le fournisseur 'replay' ne sert qu'aux tests et benchmarks hors ligne : il n'est
+# proposé dans l'interface que si une cassette est configurée.
+available_providers = [
+    provider for provider in AIClientFactory._clients
+    if provider != "replay" or os.getenv("REPLAY_CASSETTE")
+]
+# Budget total d'un tour de chat (PDF + appel à l'IA), en secondes. Doit rester
+# inférieur au `timeout` des workers (voir gunicorn.conf.py).
+REQUEST_DEADLINE_SECONDS = float(os.getenv("REQUEST_DEADLINE_SECONDS", "45"))
+
+
+def warm_up():
+    """
+    Prépare le processus courant à servir des requêtes.
+
+    Appelé une fois par worker, juste après le fork : les clients IA sont créés
+    dans le worker lui-même (leurs connexions ne doivent pas être partagées avec
+    le processus maître) et la bibliothèque PDF est chargée.
+    """
+    AIClientFactory.reset()
+    warmed = AIClientFactory.warm_up()
+    pdf_processor.warm_up()
+    return warmed
+
 
 @app.route('/', methods=['GET', 'POST'])
 def index():
@@ -24,6 +56,7 @@ def index():
     """
     # Initialisation des variables pour la requête
     error_message = None
+    status_code = 200
     user_prompt_for_template = ''
     
     # Récupérer la conversation et le fournisseur sélectionné depuis la session
@@ -37,6 +70,8 @@ def index():
         conversation.add_message(Message(role="system", content=system_prompt))
 
     if request.method == 'POST':
+        # L'échéance est fixée dès la réception : chaque étape n'aura que le budget restant.
+        deadline = Deadline.after(REQUEST_DEADLINE_SECONDS)
         user_prompt = request.form.get('text_input', '')
         user_prompt_for_template = user_prompt  # Garder une copie pour l'affichage
         file_data = request.form.get('file_data')
@@ -44,15 +79,26 @@ def index():
         session['ai_provider'] = selected_provider
 
         try:
-            ai_client = AIClientFactory.create_client(selected_provider)
+            ai_client = AIClientFactory.get_client(selected_provider)
             chat_service = ChatService(ai_client=ai_client, file_processor=pdf_processor)
 
             conversation, _ = chat_service.process_user_request(
                 conversation=conversation,
                 user_prompt=user_prompt,
-                file_data=file_data
+                file_data=file_data,
+                deadline=deadline
             )
             session['conversation'] = conversation.to_dict_list()
+        except DeadlineExceeded as e:
+            # Le tour interrompu n'est pas ajouté à la conversation : l'utilisateur peut renvoyer sa question.
+            error_message = f"La réponse a pris trop de temps ({e.stage}, limite de {REQUEST_DEADLINE_SECONDS:g} s). Veuillez réessayer."
+            status_code = 504
+            print(f"DÉLAI DÉPASSÉ : {e}")
+        except ReplayMissError as e:
+            # Mode rejeu : la requête n'a pas été enregistrée dans la cassette.
+            error_message = f"Réponse non enregistrée dans la cassette de rejeu. Détail : {e}"
+            status_code = 502
+            print(f"REJEU : {e}")
         except ValueError as e:
             # Si la factory échoue (ex: clé API manquante), on crée un message d'erreur
             error_message = f"Erreur de configuration pour '{selected_provider.capitalize()}'. Veuillez vérifier que la clé API est bien définie dans votre fichier .env. Détail : {e}"
@@ -77,7 +123,7 @@ def index():
         selected_provider=selected_provider,
         error_message=error_message,
         user_prompt=user_prompt_for_template
-    )
+    ), status_code
 
 if __name__ == '__main__':
     app.run(debug=True, port=8081)
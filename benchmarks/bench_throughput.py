@@ -0,0 +1,171 @@
+"""
+Mesure l'évolution du débit (requêtes/s) en fonction du nombre de workers.
+
+Pour chaque nombre de workers (1, 2, 4, ... jusqu'au nombre de cœurs), le script
+lance `gunicorn -c gunicorn.conf.py wsgi:app`, envoie des requêtes concurrentes
+pendant une durée fixe et affiche le débit obtenu ainsi que l'efficacité par
+rapport à un passage à l'échelle linéaire. Seules les réponses 200 comptent dans
+le débit ; les erreurs (codes HTTP, échecs réseau) sont décomptées à part.
+
+Avec `--prompt` (et éventuellement `--file` pour un tour image ou PDF), chaque
+requête est un tour de chat complet envoyé au fournisseur `--provider`. Combiné
+au fournisseur `replay` (voir `ReplayAIClient`), la charge est reproductible hors
+ligne : enregistrer une fois avec REPLAY_MODE=record, puis rejouer.
+
+Usage :
+    python benchmarks/bench_throughput.py [--duration 10] [--clients 32] [--path /]
+    REPLAY_CASSETTE=bench.jsonl REPLAY_SPEED=1 python benchmarks/bench_throughput.py \
+        --provider replay --prompt "Résume ce document." --file doc.pdf --json runs.jsonl
+"""
+import argparse
+import base64
+import json
+import mimetypes
+import os
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def worker_counts(max_workers: int):
+    """Retourne les puissances de deux jusqu'à `max_workers` inclus."""
+    counts, n = [], 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    counts.append(max_workers)
+    return counts
+
+
+def wait_until_ready(url: str, timeout: float = 30.0):
+    """Attend que le serveur réponde sur `url`."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"Le serveur n'a pas démarré sur {url}")
+
+
+def build_form(args) -> Optional[bytes]:
+    """Construit le corps du formulaire d'un tour de chat, ou None pour un simple GET."""
+    if args.prompt is None and args.file is None:
+        return None
+    form = {"text_input": args.prompt or "", "ai_provider": args.provider}
+    if args.file:
+        mime_type = mimetypes.guess_type(args.file)[0] or "application/octet-stream"
+        with open(args.file, "rb") as f:
+            encoded = base64.b64encode(f.read()).decode("ascii")
+        form["file_data"] = f"data:{mime_type};base64,{encoded}"
+    return urllib.parse.urlencode(form).encode("utf-8")
+
+
+def hammer(url: str, duration: float, body: Optional[bytes] = None) -> Counter:
+    """
+    Envoie des requêtes en boucle pendant `duration` secondes.
+
+    Retourne le décompte des résultats : 'ok' pour les réponses 200, le code HTTP
+    pour les erreurs (ex: '502' pour une réponse absente de la cassette, '504'
+    pour une échéance dépassée) et 'réseau' pour les échecs de connexion.
+    """
+    outcomes = Counter()
+    end = time.monotonic() + duration
+    while time.monotonic() < end:
+        try:
+            # Sans cookie, chaque tour part d'une conversation neuve : la requête
+            # envoyée au fournisseur est donc identique d'un appel à l'autre.
+            with urllib.request.urlopen(url, data=body, timeout=120) as response:
+                response.read()
+            outcomes["ok"] += 1
+        except urllib.error.HTTPError as e:
+            outcomes[str(e.code)] += 1
+        except OSError:
+            outcomes["réseau"] += 1
+    return outcomes
+
+
+def run(workers: int, args) -> Tuple[float, dict]:
+    """
+    Lance Gunicorn avec `workers` workers.
+
+    Returns:
+        Le débit de réponses réussies (req/s) et le décompte des erreurs par type.
+    """
+    port = args.port
+    env = dict(
+        os.environ,
+        WEB_CONCURRENCY=str(workers),
+        GUNICORN_THREADS=str(args.threads),
+        BIND=f"127.0.0.1:{port}",
+        GUNICORN_ACCESS_LOG="/dev/null",
+        FLASK_SECRET_KEY=os.getenv("FLASK_SECRET_KEY", "benchmark"),
+    )
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "wsgi:app"],
+        cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}{args.path}"
+    try:
+        wait_until_ready(url)
+        body = build_form(args)
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=args.clients) as pool:
+            outcomes = sum(pool.map(lambda _: hammer(url, args.duration, body), range(args.clients)), Counter())
+        elapsed = time.monotonic() - start
+        errors = {kind: count for kind, count in outcomes.items() if kind != "ok"}
+        return outcomes["ok"] / elapsed, errors
+    finally:
+        server.terminate()
+        server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=10.0, help="durée de chaque mesure (s)")
+    parser.add_argument("--clients", type=int, default=32, help="nombre de clients concurrents")
+    parser.add_argument("--threads", type=int, default=4, help="threads par worker")
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--port", type=int, default=8099)
+    parser.add_argument("--path", default="/")
+    parser.add_argument("--provider", default="replay", help="fournisseur utilisé pour les tours de chat")
+    parser.add_argument("--prompt", help="envoie un tour de chat (POST) au lieu d'un simple GET")
+    parser.add_argument("--file", help="image ou PDF joint à chaque tour de chat")
+    parser.add_argument("--json", help="ajoute les résultats à ce fichier JSON Lines pour comparer les exécutions")
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'req/s':>10} {'accélération':>13} {'efficacité':>11}  erreurs")
+    baseline = None
+    results = []
+    for workers in worker_counts(args.max_workers):
+        throughput, errors = run(workers, args)
+        baseline = baseline or throughput
+        speedup = throughput / baseline if baseline else 0.0
+        results.append({"workers": workers, "rps": round(throughput, 2), "errors": errors})
+        error_summary = ", ".join(f"{kind}: {count}" for kind, count in sorted(errors.items())) or "-"
+        print(f"{workers:>8} {throughput:>10.1f} {speedup:>12.2f}x {speedup / workers:>10.0%}  {error_summary}")
+
+    if args.json:
+        run_info = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "provider": args.provider if args.prompt is not None or args.file else None,
+            "file": os.path.basename(args.file) if args.file else None,
+            "clients": args.clients,
+            "threads": args.threads,
+            "results": results,
+        }
+        with open(args.json, "a", encoding="utf-8") as f:
+            f.write(json.dumps(run_info, ensure_ascii=False) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Configuration Gunicorn pour le déploiement multi-workers de l'assistant.
+
+Toutes les valeurs sont surchargeables par variables d'environnement ou par le
+fichier `.env` (voir `.env.example`), lu ici comme dans `app.py`.
+Lancement : `gunicorn -c gunicorn.conf.py wsgi:app`.
+"""
+import multiprocessing
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+bind = os.getenv("BIND", "0.0.0.0:8081")
+
+# Les appels aux fournisseurs d'IA sont dominés par l'attente réseau : des workers
+# `gthread` permettent à chaque processus de servir plusieurs tours en parallèle.
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+worker_class = "gthread"
+
+# Charge l'application dans le maître avant le fork (imports, templates).
+preload_app = True
+
+# Un tour de chat (PDF + modèle avec fichier) peut être long.
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+# Arrêt gracieux (SIGTERM / HUP) : le worker `gthread` cesse d'accepter des
+# connexions puis attend jusqu'à `graceful_timeout` que les requêtes en cours (et
+# donc les appels aux fournisseurs) se terminent, avant d'être tué par le maître.
+# Par défaut, ce délai couvre l'échéance d'une requête (REQUEST_DEADLINE_SECONDS)
+# plus une marge, pour que le tour le plus long puisse se terminer.
+_request_deadline = float(os.getenv("REQUEST_DEADLINE_SECONDS", "45"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", int(_request_deadline) + 15))
+keepalive = 5
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-")
+
+
+def post_fork(server, worker):
+    """Préchauffe les clients IA et le backend PDF dans chaque nouveau worker."""
+    from wsgi import warm_up
+
+    warmed = warm_up()
+    server.log.info("Worker %s préchauffé (fournisseurs : %s)", worker.pid, ", ".join(warmed) or "aucun")
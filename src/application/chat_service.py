@@ -1,7 +1,8 @@
 import base64
-from typing import Tuple, Union, List, Dict
+from typing import Tuple, Union, List, Dict, Optional
 
-from src.application.ports.ai_client import AIClient
+from src.application.deadline import Deadline
+from src.application.ports.ai_client import AIClient, AIClientError
 from src.application.ports.file_processor import FileProcessor
 from src.domaine.conversation import Conversation
 from src.domaine.message import Message
@@ -27,7 +28,8 @@ class ChatService:
         self.ai_client = ai_client
         self.file_processor = file_processor
 
-    def process_user_request(self, conversation: Conversation, user_prompt: str, file_data: str = None, provider: str = "openai") -> Tuple[Conversation, str]:
+    def process_user_request(self, conversation: Conversation, user_prompt: str, file_data: str = None, provider: str = "openai",
+                             deadline: Optional[Deadline] = None) -> Tuple[Conversation, str]:
         """
         Traite la requête complète d'un utilisateur.
 
@@ -39,18 +41,25 @@ class ChatService:
             user_prompt (str): Le message textuel de l'utilisateur.
             file_data (str, optional): Les données d'un fichier joint, encodées en base64.
             provider (str): Le fournisseur d'IA sélectionné ('openai', 'claude', 'gemini').
+            deadline (Deadline, optional): L'échéance de la requête, transmise à
+                                           chaque étape (PDF, blague, appel à l'IA).
 
         Returns:
             Un tuple contenant la conversation mise à jour et la réponse textuelle de l'assistant.
+
+        Raises:
+            DeadlineExceeded: Si l'échéance est dépassée. La conversation n'est alors
+                              pas modifiée : les messages de l'utilisateur et de
+                              l'assistant ne sont ajoutés qu'une fois la réponse obtenue.
         """
-        user_message_content = self._build_user_content(user_prompt, file_data)
+        user_message_content = self._build_user_content(user_prompt, file_data, deadline)
         
         if not user_message_content:
             return conversation, "Veuillez fournir un message ou un fichier."
         
         # --- Détection d'une demande de blague (universel) ---
         if self._is_joke_request(user_prompt):
-            joke = get_dad_joke()
+            joke = get_dad_joke(deadline=deadline)
             conversation.add_message(Message(role="user", content=user_message_content))
             conversation.add_message(Message(role="assistant", content=joke))
             return conversation, joke
@@ -58,13 +67,19 @@ class ChatService:
         # Sélectionner le modèle approprié selon le fournisseur
         model = self._get_model_for_provider(provider, file_data)
         
-        conversation.add_message(Message(role="user", content=user_message_content))
-        
-        response_text = self.ai_client.get_chat_completion(
-            messages=conversation.to_dict_list(),
-            model=model
-        )
+        # Le message utilisateur n'est ajouté à la conversation qu'après la réponse,
+        # pour qu'un appel interrompu (ex: échéance dépassée) ne laisse pas de tour incomplet.
+        user_message = Message(role="user", content=user_message_content)
+        try:
+            response_text = self.ai_client.get_chat_completion(
+                messages=conversation.to_dict_list() + [user_message.to_dict()],
+                model=model,
+                deadline=deadline
+            )
+        except AIClientError as e:
+            response_text = f"Désolé, une erreur est survenue lors de la communication avec {e.provider}."
         
+        conversation.add_message(user_message)
         conversation.add_message(Message(role="assistant", content=response_text))
         return conversation, response_text
 
@@ -114,7 +129,7 @@ class ChatService:
         provider_models = models.get(provider.lower(), models["openai"])
         return provider_models["with_file"] if has_file else provider_models["default"]
 
-    def _build_user_content(self, user_prompt: str, file_data: str) -> Union[str, List[Dict]]:
+    def _build_user_content(self, user_prompt: str, file_data: str, deadline: Optional[Deadline] = None) -> Union[str, List[Dict]]:
         """
         Construit le contenu du message utilisateur à partir du prompt et du fichier.
 
@@ -124,6 +139,7 @@ class ChatService:
         Args:
             user_prompt (str): Le texte de l'utilisateur.
             file_data (str): Les données du fichier en base64.
+            deadline (Deadline, optional): L'échéance transmise à l'extraction PDF.
 
         Returns:
             Le contenu formaté pour l'API OpenAI (soit un str, soit une liste de dictionnaires).
@@ -142,7 +158,7 @@ class ChatService:
             
             elif "pdf" in header:
                 file_bytes = base64.b64decode(encoded)
-                pdf_text = self.file_processor.extract_text_from_pdf(file_bytes)
+                pdf_text = self.file_processor.extract_text_from_pdf(file_bytes, deadline=deadline)
                 full_prompt = (
                     f"Analyse le contenu du PDF suivant et réponds à la question de l'utilisateur.\n\n"
                     f"--- CONTENU DU PDF ---\n{pdf_text}\n--- FIN DU PDF ---\n\n"
@@ -0,0 +1,76 @@
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+
+class DeadlineExceeded(TimeoutError):
+    """
+    Levée lorsqu'une étape du traitement d'une requête dépasse son échéance.
+
+    Attributes:
+        stage (str): L'étape interrompue (ex: 'extraction PDF', 'appel OpenAI').
+    """
+
+    def __init__(self, stage: str):
+        super().__init__(f"Délai dépassé pendant l'étape : {stage}")
+        self.stage = stage
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """
+    Représente l'échéance de bout en bout d'une requête utilisateur.
+
+    Créée une seule fois par le point d'entrée web, elle est transmise à chaque
+    étape (extraction PDF, appel au fournisseur d'IA, API de blagues). Chaque
+    étape n'utilise que le budget restant, et s'interrompt dès qu'il est épuisé
+    au lieu de bloquer le worker plus longtemps que l'utilisateur n'attendra.
+
+    Attributes:
+        expires_at (float): L'instant d'expiration, sur l'horloge `time.monotonic()`.
+    """
+    expires_at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> "Deadline":
+        """Crée une échéance expirant dans `seconds` secondes."""
+        return cls(expires_at=time.monotonic() + seconds)
+
+    def remaining(self) -> float:
+        """Retourne le budget restant en secondes (jamais négatif)."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Indique si l'échéance est dépassée."""
+        return time.monotonic() >= self.expires_at
+
+    def check(self, stage: str):
+        """
+        Vérifie que l'échéance n'est pas dépassée.
+
+        Args:
+            stage (str): L'étape en cours, reprise dans l'erreur.
+
+        Raises:
+            DeadlineExceeded: Si l'échéance est dépassée.
+        """
+        if self.expired():
+            raise DeadlineExceeded(stage)
+
+    def timeout(self, stage: str, cap: Optional[float] = None) -> float:
+        """
+        Retourne le délai à accorder à un appel bloquant (réseau, SDK).
+
+        Args:
+            stage (str): L'étape en cours, reprise dans l'erreur.
+            cap (float, optional): Un délai maximal propre à l'étape.
+
+        Returns:
+            Le budget restant, éventuellement plafonné par `cap`.
+
+        Raises:
+            DeadlineExceeded: Si l'échéance est déjà dépassée.
+        """
+        self.check(stage)
+        remaining = self.remaining()
+        return min(remaining, cap) if cap is not None else remaining
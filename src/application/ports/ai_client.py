@@ -1,5 +1,25 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+from src.application.deadline import Deadline
+
+class AIClientError(Exception):
+    """
+    Levée par un adapter lorsque l'appel au fournisseur d'IA échoue.
+
+    Les adapters ne renvoient pas de message d'excuse à la place d'une réponse :
+    c'est le service applicatif qui décide de ce qui est présenté à l'utilisateur.
+    Les adapters qui enveloppent un autre client (ex: l'enregistrement de cassettes)
+    peuvent ainsi distinguer un échec d'une véritable réponse.
+
+    Attributes:
+        provider (str): Le nom du fournisseur concerné (ex: 'OpenAI').
+    """
+
+    def __init__(self, provider: str, detail: str):
+        super().__init__(f"Erreur de l'API {provider} : {detail}")
+        self.provider = provider
+
 
 class AIClient(ABC):
     """
@@ -16,7 +36,7 @@ class AIClient(ABC):
     """
 
     @abstractmethod
-    def get_chat_completion(self, messages: List[Dict], model: str) -> str:
+    def get_chat_completion(self, messages: List[Dict], model: str, deadline: Optional[Deadline] = None) -> str:
         """
         Obtient une complétion de chat à partir d'un modèle d'IA.
 
@@ -26,8 +46,14 @@ class AIClient(ABC):
             messages (List[Dict]): Une liste de dictionnaires de messages,
                                    représentant l'historique de la conversation.
             model (str): Le nom du modèle à utiliser pour la complétion.
+            deadline (Deadline, optional): L'échéance de la requête. L'appel ne doit
+                                           pas dépasser le budget restant.
 
         Returns:
             Le contenu textuel du message de réponse de l'IA.
+
+        Raises:
+            DeadlineExceeded: Si l'échéance est dépassée avant ou pendant l'appel.
+            AIClientError: Si l'appel au fournisseur échoue.
         """
         pass 
\ No newline at end of file
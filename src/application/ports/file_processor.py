@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.application.deadline import Deadline
 
 class FileProcessor(ABC):
     """
@@ -15,14 +18,19 @@ class FileProcessor(ABC):
     """
 
     @abstractmethod
-    def extract_text_from_pdf(self, pdf_bytes: bytes) -> str:
+    def extract_text_from_pdf(self, pdf_bytes: bytes, deadline: Optional[Deadline] = None) -> str:
         """
         Extrait le contenu textuel d'un fichier PDF fourni en bytes.
 
         Args:
             pdf_bytes (bytes): Le contenu binaire du fichier PDF.
+            deadline (Deadline, optional): L'échéance de la requête, vérifiée
+                                           entre chaque page.
 
         Returns:
             Le texte extrait du document.
+
+        Raises:
+            DeadlineExceeded: Si l'échéance est dépassée pendant l'extraction.
         """
         pass 
\ No newline at end of file
@@ -1,7 +1,11 @@
+import threading
+from typing import Dict, List
+
 from src.application.ports.ai_client import AIClient
 from src.infrastructure.openai_client import OpenAIClient
 from src.infrastructure.claude_client import ClaudeClient
 from src.infrastructure.gemini_client import GeminiClient
+from src.infrastructure.replay_client import ReplayAIClient
 
 class AIClientFactory:
     """
@@ -18,7 +22,13 @@ class AIClientFactory:
         "openai": OpenAIClient,
         "claude": ClaudeClient,
         "gemini": GeminiClient,
+        # Rejoue (ou enregistre) des réponses depuis une cassette, pour les tests hors ligne.
+        "replay": ReplayAIClient,
     }
+    # Instances partagées par processus (un worker = un cache), créées à la demande
+    # ou lors du préchauffage du worker.
+    _instances: Dict[str, AIClient] = {}
+    _lock = threading.Lock()
 
     @classmethod
     def create_client(cls, provider_name: str) -> AIClient:
@@ -28,7 +38,7 @@ class AIClientFactory:
         Cette méthode de classe agit comme le constructeur public pour la factory.
 
         Args:
-            provider_name (str): Le nom du fournisseur ('openai', 'claude', 'gemini').
+            provider_name (str): Le nom du fournisseur ('openai', 'claude', 'gemini', 'replay').
                                  La casse est ignorée.
 
         Returns:
@@ -44,4 +54,60 @@ class AIClientFactory:
             raise ValueError(f"Fournisseur d'IA non supporté : {provider_name}. "
                              f"Les fournisseurs valides sont : {list(cls._clients.keys())}")
         
-        return client_class() 
\ No newline at end of file
+        return client_class()
+
+    @classmethod
+    def get_client(cls, provider_name: str) -> AIClient:
+        """
+        Retourne l'instance partagée du client IA pour ce fournisseur.
+
+        Contrairement à `create_client`, l'instance est mise en cache pour la durée
+        de vie du processus : les requêtes suivantes d'un même worker réutilisent
+        le client au lieu d'en reconstruire un à chaque fois. Les clients OpenAI
+        (`requests.Session`) et Claude (SDK Anthropic) conservent en plus leur pool
+        de connexions HTTP d'une requête à l'autre.
+
+        Args:
+            provider_name (str): Le nom du fournisseur. La casse est ignorée.
+
+        Returns:
+            L'instance partagée du client IA.
+
+        Raises:
+            ValueError: Si le fournisseur n'est pas supporté ou mal configuré.
+        """
+        provider_name = provider_name.lower()
+        client = cls._instances.get(provider_name)
+        if client is None:
+            with cls._lock:
+                client = cls._instances.get(provider_name)
+                if client is None:
+                    client = cls.create_client(provider_name)
+                    cls._instances[provider_name] = client
+        return client
+
+    @classmethod
+    def warm_up(cls) -> List[str]:
+        """
+        Instancie à l'avance tous les clients IA configurés dans le processus courant.
+
+        Les fournisseurs dont la clé API est absente sont ignorés : l'erreur sera
+        remontée normalement lors de la première requête qui les utilise.
+
+        Returns:
+            La liste des fournisseurs effectivement préchauffés.
+        """
+        warmed = []
+        for provider_name in cls._clients:
+            try:
+                cls.get_client(provider_name)
+                warmed.append(provider_name)
+            except ValueError:
+                continue
+        return warmed
+
+    @classmethod
+    def reset(cls):
+        """Vide le cache d'instances (ex: après un fork, ou dans les tests)."""
+        with cls._lock:
+            cls._instances.clear()
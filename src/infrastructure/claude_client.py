@@ -1,10 +1,11 @@
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 import anthropic
 from dotenv import load_dotenv
 
-from src.application.ports.ai_client import AIClient
+from src.application.deadline import Deadline, DeadlineExceeded
+from src.application.ports.ai_client import AIClient, AIClientError
 
 load_dotenv()
 
@@ -19,12 +20,16 @@ class ClaudeClient(AIClient):
             raise ValueError("La clé API Anthropic (Claude) n'est pas définie.")
         self.client = anthropic.Anthropic(api_key=self.api_key)
 
-    def get_chat_completion(self, messages: List[Dict], model: str = "claude-3-opus-20240229") -> str:
+    def get_chat_completion(self, messages: List[Dict], model: str = "claude-3-opus-20240229", deadline: Optional[Deadline] = None) -> str:
         """
         Envoie une requête de complétion de chat à l'API Claude.
         
         Note : Claude attend un message système séparé et n'accepte pas le rôle 'system'
         dans la liste de messages principale. Cette méthode adapte le format.
+
+        Avec une échéance, l'appel reçoit le budget restant comme délai et les
+        nouvelles tentatives automatiques du SDK sont désactivées : elles ne
+        pourraient que dépasser l'échéance.
         """
         system_prompt = ""
         # Sépare le message système du reste de la conversation
@@ -34,8 +39,12 @@ class ClaudeClient(AIClient):
         else:
             messages_for_api = messages
 
+        client = self.client
+        if deadline:
+            client = client.with_options(timeout=deadline.timeout("appel Claude"), max_retries=0)
+
         try:
-            response = self.client.messages.create(
+            response = client.messages.create(
                 model=model,
                 max_tokens=1024,
                 system=system_prompt,
@@ -43,5 +52,7 @@ class ClaudeClient(AIClient):
             )
             return response.content[0].text
         except Exception as e:
+            if deadline and deadline.expired():
+                raise DeadlineExceeded("appel Claude") from e
             print(f"Une erreur API est survenue avec Claude : {e}")
-            return "Désolé, une erreur est survenue lors de la communication avec Claude." 
\ No newline at end of file
+            raise AIClientError("Claude", str(e)) from e 
\ No newline at end of file
@@ -1,11 +1,12 @@
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional
 import base64
 
 import google.generativeai as genai
 from dotenv import load_dotenv
 
-from src.application.ports.ai_client import AIClient
+from src.application.deadline import Deadline, DeadlineExceeded
+from src.application.ports.ai_client import AIClient, AIClientError
 
 load_dotenv()
 
@@ -20,7 +21,7 @@ class GeminiClient(AIClient):
             raise ValueError("La clé API Google (Gemini) n'est pas définie.")
         genai.configure(api_key=self.api_key)
 
-    def get_chat_completion(self, messages: List[Dict], model: str = "gemini-1.5-flash") -> str:
+    def get_chat_completion(self, messages: List[Dict], model: str = "gemini-1.5-flash", deadline: Optional[Deadline] = None) -> str:
         """
         Envoie une requête de complétion de chat à l'API Gemini.
 
@@ -43,13 +44,17 @@ class GeminiClient(AIClient):
         # Le dernier message est celui à envoyer
         last_user_message = self._format_messages_for_gemini(messages[-1:])
 
+        request_options = {"timeout": deadline.timeout("appel Gemini")} if deadline else None
+
         try:
             # Envoi du dernier message
-            response = chat_session.send_message(last_user_message)
+            response = chat_session.send_message(last_user_message, request_options=request_options)
             return response.text
         except Exception as e:
+            if deadline and deadline.expired():
+                raise DeadlineExceeded("appel Gemini") from e
             print(f"Une erreur API est survenue avec Gemini : {e}")
-            return "Désolé, une erreur est survenue lors de la communication avec Gemini."
+            raise AIClientError("Gemini", str(e)) from e
 
     def _format_messages_for_gemini(self, messages: List[Dict]) -> List[Dict]:
         """Convertit une liste de messages de notre format à celui de Gemini."""
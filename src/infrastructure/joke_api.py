@@ -1,17 +1,28 @@
+from typing import Optional
+
 import requests
 
-def get_dad_joke() -> str:
+from src.application.deadline import Deadline, DeadlineExceeded
+
+def get_dad_joke(deadline: Optional[Deadline] = None) -> str:
     """
     Récupère une blague (dad joke) depuis l'API icanhazdadjoke.com.
+    Args:
+        deadline (Deadline, optional): L'échéance de la requête.
     Returns:
         str: La blague récupérée, ou un message d'erreur.
+    Raises:
+        DeadlineExceeded: Si l'échéance est dépassée avant ou pendant l'appel.
     """
     url = "https://icanhazdadjoke.com/"
     headers = {"Accept": "application/json", "User-Agent": "VoixAssistant/1.0"}
+    timeout = deadline.timeout("API de blagues", cap=10) if deadline else 10
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = requests.get(url, headers=headers, timeout=timeout)
         response.raise_for_status()
         data = response.json()
         return data.get("joke", "Pas de blague trouvée.")
     except Exception as e:
+        if deadline and deadline.expired():
+            raise DeadlineExceeded("API de blagues") from e
         return f"Erreur lors de la récupération de la blague : {e}" 
\ No newline at end of file
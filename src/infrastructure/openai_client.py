@@ -1,9 +1,10 @@
 import os
 import requests
 from dotenv import load_dotenv
-from typing import List, Dict
+from typing import List, Dict, Optional
 
-from src.application.ports.ai_client import AIClient
+from src.application.deadline import Deadline, DeadlineExceeded
+from src.application.ports.ai_client import AIClient, AIClientError
 
 load_dotenv()
 
@@ -14,8 +15,13 @@ class OpenAIClient(AIClient):
     Cette classe adapte l'interface générique `AIClient` définie dans l'application
     aux spécificités de l'API OpenAI. Elle gère la construction de la requête HTTP,
     l'authentification et l'interprétation de la réponse.
+
+    Les requêtes passent par une `requests.Session` propre à l'instance : une
+    instance partagée par un worker (voir `AIClientFactory.get_client`) réutilise
+    ainsi ses connexions HTTPS au lieu de refaire une poignée de main TLS à chaque tour.
     """
     API_URL = "https://api.openai.com/v1/chat/completions"
+    TIMEOUT = 60  # Délai maximal d'un appel, en secondes, même avec un budget plus large
 
     def __init__(self):
         """Initialise le client en chargeant la clé d'API depuis les variables d'environnement."""
@@ -26,27 +32,36 @@ class OpenAIClient(AIClient):
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        self.session = requests.Session()
 
-    def get_chat_completion(self, messages: List[Dict], model: str = "gpt-3.5-turbo") -> str:
+    def get_chat_completion(self, messages: List[Dict], model: str = "gpt-3.5-turbo", deadline: Optional[Deadline] = None) -> str:
         """
         Envoie une requête de complétion de chat à l'API OpenAI.
 
         Args:
             messages (List[Dict]): L'historique de la conversation.
             model (str): Le modèle OpenAI à utiliser (ex: 'gpt-3.5-turbo', 'gpt-4o').
+            deadline (Deadline, optional): L'échéance de la requête.
 
         Returns:
             La réponse textuelle de l'assistant.
+
+        Raises:
+            DeadlineExceeded: Si l'échéance est dépassée avant ou pendant l'appel.
+            AIClientError: Si l'appel à l'API échoue.
         """
         data = {
             "model": model,
             "messages": messages
         }
+        timeout = deadline.timeout("appel OpenAI", cap=self.TIMEOUT) if deadline else self.TIMEOUT
         try:
-            response = requests.post(self.API_URL, headers=self.headers, json=data, timeout=60)
+            response = self.session.post(self.API_URL, headers=self.headers, json=data, timeout=timeout)
             response.raise_for_status()  # Lève une exception pour les codes d'erreur HTTP
             return response.json()["choices"][0]["message"]["content"]
         except requests.RequestException as e:
+            if deadline and deadline.expired():
+                raise DeadlineExceeded("appel OpenAI") from e
             print(f"Une erreur API est survenue : {e}")
             # Dans une application réelle, il faudrait un logger et une gestion d'erreurs plus fine.
-            return "Désolé, une erreur est survenue lors de la communication avec l'IA." 
\ No newline at end of file
+            raise AIClientError("OpenAI", str(e)) from e 
\ No newline at end of file
@@ -1,4 +1,7 @@
+from typing import Optional
+
 import fitz  # PyMuPDF
+from src.application.deadline import Deadline, DeadlineExceeded
 from src.application.ports.file_processor import FileProcessor
 
 class PyMuPDFProcessor(FileProcessor):
@@ -8,25 +11,44 @@ class PyMuPDFProcessor(FileProcessor):
     Cette classe utilise la bibliothèque PyMuPDF (via le module `fitz`) pour
     implémenter la logique d'extraction de texte définie par le port `FileProcessor`.
     """
-    def extract_text_from_pdf(self, pdf_bytes: bytes) -> str:
+    def extract_text_from_pdf(self, pdf_bytes: bytes, deadline: Optional[Deadline] = None) -> str:
         """
         Extrait le texte d'un PDF à partir de son contenu binaire.
 
         Args:
             pdf_bytes (bytes): Le contenu binaire du fichier PDF.
+            deadline (Deadline, optional): L'échéance de la requête, vérifiée avant chaque page.
 
         Returns:
             Le texte extrait, ou un message d'erreur si l'extraction échoue.
+
+        Raises:
+            DeadlineExceeded: Si l'échéance est dépassée pendant l'extraction.
         """
         text = ""
         try:
             # `fitz.open` peut lire un document à partir d'un flux de bytes.
             with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
                 for page in doc:
+                    if deadline:
+                        deadline.check("extraction PDF")
                     text += page.get_text()
             return text
+        except DeadlineExceeded:
+            raise
         except Exception as e:
             # Gestion d'erreur basique. Dans une application de production,
             # un logger serait plus approprié.
             print(f"Erreur lors de l'extraction du texte du PDF : {e}")
-            return "Impossible d'extraire le contenu de ce PDF." 
\ No newline at end of file
+            return "Impossible d'extraire le contenu de ce PDF."
+
+    def warm_up(self):
+        """
+        Charge la bibliothèque MuPDF en ouvrant un document vide.
+
+        Appelé au démarrage de chaque worker pour que la première requête PDF ne
+        paie pas le coût d'initialisation de la bibliothèque native.
+        """
+        with fitz.open() as doc:
+            doc.new_page()
+            doc.tobytes()
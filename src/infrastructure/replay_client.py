@@ -0,0 +1,158 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from src.application.deadline import Deadline, DeadlineExceeded
+from src.application.ports.ai_client import AIClient
+
+load_dotenv()
+
+
+class ReplayMissError(LookupError):
+    """Levée en mode replay lorsqu'aucune réponse enregistrée ne correspond à la requête."""
+
+
+class ReplayAIClient(AIClient):
+    """
+    Adapter d'enregistrement / rejeu (record/replay) implémentant AIClient.
+
+    En mode `record`, il délègue chaque requête à un vrai client IA et enregistre
+    la réponse dans une cassette (fichier JSON Lines). Une requête déjà présente
+    dans la cassette est rejouée plutôt que renvoyée au fournisseur : un benchmark
+    lancé en mode `record` ne paie donc qu'un appel par requête distincte. En mode
+    `replay`, il rejoue ces réponses sans aucun accès réseau, ce qui rend les tests
+    et les benchmarks de `ChatService` déterministes et exécutables hors ligne.
+
+    La cassette est compacte : une requête y est identifiée par l'empreinte SHA-256
+    du modèle et des messages (images et PDF inclus), sans stocker leur contenu.
+    Chaque réponse est enregistrée comme une suite de fragments horodatés
+    `[décalage_en_secondes, texte]` : un seul fragment pour les clients classiques,
+    un par morceau reçu si le client enregistré expose `stream_chat_completion`.
+    Un appel qui échoue (`AIClientError`, échéance dépassée) n'est pas enregistré :
+    il sera retenté lors du prochain enregistrement.
+
+    Configuration (arguments ou variables d'environnement) :
+        REPLAY_CASSETTE: Le chemin du fichier cassette (obligatoire).
+        REPLAY_MODE: 'replay' (défaut) ou 'record'.
+        REPLAY_TARGET: Le fournisseur réel à enregistrer en mode 'record' (défaut 'openai').
+        REPLAY_SPEED: Facteur de vitesse du rejeu. 1 rejoue les délais d'origine,
+                      2 deux fois plus vite, 0 sans aucune attente (défaut 1).
+    """
+
+    def __init__(self, cassette_path: Optional[str] = None, mode: Optional[str] = None,
+                 inner: Optional[AIClient] = None, speed: Optional[float] = None):
+        """Initialise le client et charge la cassette existante."""
+        self.cassette_path = cassette_path or os.getenv("REPLAY_CASSETTE")
+        if not self.cassette_path:
+            raise ValueError("Le chemin de la cassette (REPLAY_CASSETTE) n'est pas défini.")
+        self.mode = (mode or os.getenv("REPLAY_MODE", "replay")).lower()
+        if self.mode not in ("record", "replay"):
+            raise ValueError(f"Mode de rejeu inconnu : {self.mode}. Les modes valides sont 'record' et 'replay'.")
+        self.speed = float(speed if speed is not None else os.getenv("REPLAY_SPEED", "1"))
+
+        self.inner = inner
+        if self.mode == "record" and self.inner is None:
+            # Import local : la factory référence elle-même cette classe.
+            from src.infrastructure.ai_client_factory import AIClientFactory
+            self.inner = AIClientFactory.create_client(os.getenv("REPLAY_TARGET", "openai"))
+
+        self._lock = threading.Lock()
+        self._interactions: Dict[str, List[List[Tuple[float, str]]]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._load()
+
+    @staticmethod
+    def request_key(messages: List[Dict], model: str) -> str:
+        """Calcule l'empreinte stable d'une requête (modèle + messages)."""
+        payload = json.dumps({"model": model, "messages": messages}, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get_chat_completion(self, messages: List[Dict], model: str = "gpt-3.5-turbo", deadline: Optional[Deadline] = None) -> str:
+        """
+        Retourne la réponse enregistrée (replay) ou obtenue du vrai client (record).
+
+        Raises:
+            ReplayMissError: En mode replay, si la requête n'est pas dans la cassette.
+            DeadlineExceeded: Si l'échéance est dépassée avant le dernier fragment.
+        """
+        return "".join(self.stream_chat_completion(messages, model, deadline=deadline))
+
+    def stream_chat_completion(self, messages: List[Dict], model: str = "gpt-3.5-turbo",
+                               deadline: Optional[Deadline] = None) -> Iterator[str]:
+        """
+        Produit la réponse fragment par fragment, en respectant le minutage enregistré.
+
+        En mode replay, chaque fragment est émis à son décalage d'origine divisé
+        par `speed`. En mode record, les fragments sont transmis au fur et à
+        mesure et la cassette est complétée une fois la réponse terminée.
+        """
+        key = self.request_key(messages, model)
+        if self.mode == "record" and key not in self._interactions:
+            yield from self._record(key, messages, model, deadline)
+        else:
+            yield from self._replay(key, deadline)
+
+    def _record(self, key: str, messages: List[Dict], model: str, deadline: Optional[Deadline]) -> Iterator[str]:
+        """
+        Délègue au client réel et enregistre les fragments avec leur minutage.
+
+        La cassette n'est complétée qu'une fois la réponse entièrement reçue : si le
+        client réel lève une exception, elle est propagée et rien n'est écrit.
+        """
+        chunks = []
+        start = time.monotonic()
+        if hasattr(self.inner, "stream_chat_completion"):
+            for text in self.inner.stream_chat_completion(messages=messages, model=model, deadline=deadline):
+                chunks.append((round(time.monotonic() - start, 4), text))
+                yield text
+        else:
+            text = self.inner.get_chat_completion(messages=messages, model=model, deadline=deadline)
+            chunks.append((round(time.monotonic() - start, 4), text))
+            yield text
+
+        with self._lock:
+            self._interactions.setdefault(key, []).append(chunks)
+            with open(self.cassette_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"key": key, "model": model, "chunks": chunks}, ensure_ascii=False) + "\n")
+
+    def _replay(self, key: str, deadline: Optional[Deadline]) -> Iterator[str]:
+        """Rejoue une réponse enregistrée ; les réponses multiples d'une même requête sont rejouées en boucle."""
+        with self._lock:
+            responses = self._interactions.get(key)
+            if not responses:
+                raise ReplayMissError(f"Aucune réponse enregistrée pour la requête {key[:12]} dans {self.cassette_path}.")
+            index = self._cursors.get(key, 0)
+            self._cursors[key] = index + 1
+            chunks = responses[index % len(responses)]
+
+        start = time.monotonic()
+        for offset, text in chunks:
+            if self.speed > 0:
+                delay = offset / self.speed - (time.monotonic() - start)
+                if deadline and delay > deadline.remaining():
+                    # Le fragment n'arriverait qu'après l'échéance : on attend
+                    # jusqu'à celle-ci, comme le ferait une lecture réseau.
+                    time.sleep(deadline.remaining())
+                    raise DeadlineExceeded("rejeu de la cassette")
+                if delay > 0:
+                    time.sleep(delay)
+            if deadline:
+                deadline.check("rejeu de la cassette")
+            yield text
+
+    def _load(self):
+        """Charge les interactions de la cassette, si elle existe déjà."""
+        if not os.path.exists(self.cassette_path):
+            return
+        with open(self.cassette_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                chunks = [(float(offset), text) for offset, text in entry["chunks"]]
+                self._interactions.setdefault(entry["key"], []).append(chunks)
@@ -0,0 +1,40 @@
+import pytest
+from src.infrastructure.ai_client_factory import AIClientFactory
+from src.infrastructure.openai_client import OpenAIClient
+
+@pytest.fixture(autouse=True)
+def clean_factory(monkeypatch):
+    """Vide le cache de la factory et ne laisse que la clé OpenAI configurée."""
+    for name in ("ANTHROPIC_API_KEY", "GOOGLE_API_KEY", "REPLAY_CASSETTE"):
+        monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv("OPENAI_API_KEY", "test_key")
+    AIClientFactory.reset()
+    yield
+    AIClientFactory.reset()
+
+def test_get_client_is_cached():
+    """Teste que get_client retourne la même instance pour un même fournisseur."""
+    client = AIClientFactory.get_client("OpenAI")
+    assert isinstance(client, OpenAIClient)
+    assert AIClientFactory.get_client("openai") is client
+
+def test_create_client_is_not_cached():
+    """Teste que create_client construit toujours une nouvelle instance."""
+    assert AIClientFactory.create_client("openai") is not AIClientFactory.create_client("openai")
+
+def test_reset_clears_cache():
+    """Teste que reset force la création d'une nouvelle instance."""
+    client = AIClientFactory.get_client("openai")
+    AIClientFactory.reset()
+    assert AIClientFactory.get_client("openai") is not client
+
+def test_warm_up_skips_unconfigured_providers():
+    """Teste que le préchauffage ignore les fournisseurs sans clé API."""
+    assert AIClientFactory.warm_up() == ["openai"]
+    assert list(AIClientFactory._instances) == ["openai"]
+
+def test_get_client_unknown_provider():
+    """Teste qu'un fournisseur inconnu lève ValueError et n'est pas mis en cache."""
+    with pytest.raises(ValueError, match="non supporté"):
+        AIClientFactory.get_client("inconnu")
+    assert "inconnu" not in AIClientFactory._instances
@@ -0,0 +1,62 @@
+import importlib
+
+import pytest
+from unittest.mock import MagicMock
+import app as app_module
+from src.application.deadline import DeadlineExceeded
+from src.infrastructure.ai_client_factory import AIClientFactory
+
+def load_app(monkeypatch, **env):
+    """Recharge app.py avec l'environnement donné et retourne un client de test Flask."""
+    monkeypatch.delenv("REPLAY_CASSETTE", raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    module = importlib.reload(app_module)
+    module.app.config["TESTING"] = True
+    return module, module.app.test_client()
+
+@pytest.fixture(autouse=True)
+def clean_factory():
+    """Vide le cache de clients IA entre les tests."""
+    AIClientFactory.reset()
+    yield
+    AIClientFactory.reset()
+
+def test_replay_hidden_without_cassette(monkeypatch):
+    """Teste que le fournisseur de rejeu n'apparaît pas dans l'interface sans cassette."""
+    module, client = load_app(monkeypatch)
+    response = client.get("/")
+    assert response.status_code == 200
+    assert "replay" not in module.available_providers
+    assert 'value="replay"' not in response.get_data(as_text=True)
+
+def test_replay_listed_with_cassette(monkeypatch, tmp_path):
+    """Teste que le fournisseur de rejeu est proposé lorsqu'une cassette est configurée."""
+    module, _ = load_app(monkeypatch, REPLAY_CASSETTE=str(tmp_path / "cassette.jsonl"))
+    assert "replay" in module.available_providers
+
+def test_replay_miss_returns_error(monkeypatch, tmp_path):
+    """Teste qu'une requête absente de la cassette renvoie une erreur explicite, sans sauvegarder le tour."""
+    _, client = load_app(monkeypatch, REPLAY_CASSETTE=str(tmp_path / "cassette.jsonl"), REPLAY_MODE="replay")
+    response = client.post("/", data={"text_input": "Bonjour", "ai_provider": "replay"})
+
+    assert response.status_code == 502
+    assert "non enregistrée dans la cassette" in response.get_data(as_text=True)
+    with client.session_transaction() as session:
+        assert "conversation" not in session
+
+def test_deadline_exceeded_returns_504(monkeypatch):
+    """Teste qu'un tour dépassant l'échéance renvoie 504 avec un message de délai, sans sauvegarder le tour."""
+    _, client = load_app(monkeypatch)
+    ai_client = MagicMock()
+    ai_client.get_chat_completion.side_effect = DeadlineExceeded("appel OpenAI")
+    monkeypatch.setattr(AIClientFactory, "get_client", classmethod(lambda cls, name: ai_client))
+
+    response = client.post("/", data={"text_input": "Bonjour", "ai_provider": "openai"})
+
+    assert response.status_code == 504
+    body = response.get_data(as_text=True)
+    assert "La réponse a pris trop de temps" in body and "appel OpenAI" in body
+    assert "deadline" in ai_client.get_chat_completion.call_args.kwargs
+    with client.session_transaction() as session:
+        assert "conversation" not in session
@@ -0,0 +1,48 @@
+import pytest
+from unittest.mock import MagicMock
+from src.application.chat_service import ChatService
+from src.application.deadline import Deadline, DeadlineExceeded
+from src.application.ports.ai_client import AIClientError
+from src.domaine.conversation import Conversation
+from src.domaine.message import Message
+
+@pytest.fixture
+def conversation():
+    """Une conversation contenant uniquement le message système."""
+    return Conversation(messages=[Message(role="system", content="Tu es un assistant.")])
+
+def test_process_user_request(conversation):
+    """Teste qu'un tour réussi ajoute les messages utilisateur et assistant, et transmet l'échéance."""
+    ai_client = MagicMock()
+    ai_client.get_chat_completion.return_value = "Bonjour !"
+    deadline = Deadline.after(10)
+    service = ChatService(ai_client=ai_client, file_processor=MagicMock())
+
+    conversation, response = service.process_user_request(conversation, "Salut", deadline=deadline)
+
+    assert response == "Bonjour !"
+    assert [m.role for m in conversation.messages] == ["system", "user", "assistant"]
+    kwargs = ai_client.get_chat_completion.call_args.kwargs
+    assert kwargs["messages"][-1] == {"role": "user", "content": "Salut"}
+    assert kwargs["deadline"] is deadline
+
+def test_deadline_exceeded_leaves_conversation_unchanged(conversation):
+    """Teste qu'un tour interrompu par l'échéance ne modifie pas la conversation."""
+    ai_client = MagicMock()
+    ai_client.get_chat_completion.side_effect = DeadlineExceeded("appel OpenAI")
+    service = ChatService(ai_client=ai_client, file_processor=MagicMock())
+
+    with pytest.raises(DeadlineExceeded):
+        service.process_user_request(conversation, "Salut", deadline=Deadline.after(10))
+    assert [m.role for m in conversation.messages] == ["system"]
+
+def test_ai_client_error_returns_apology(conversation):
+    """Teste qu'une erreur du fournisseur est présentée comme un message d'excuse de l'assistant."""
+    ai_client = MagicMock()
+    ai_client.get_chat_completion.side_effect = AIClientError("Claude", "Erreur serveur")
+    service = ChatService(ai_client=ai_client, file_processor=MagicMock())
+
+    conversation, response = service.process_user_request(conversation, "Salut")
+
+    assert response == "Désolé, une erreur est survenue lors de la communication avec Claude."
+    assert conversation.messages[-1].content == response
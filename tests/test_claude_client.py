@@ -0,0 +1,53 @@
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+from src.application.deadline import Deadline, DeadlineExceeded
+from src.application.ports.ai_client import AIClientError
+from src.infrastructure.claude_client import ClaudeClient
+
+MESSAGES = [
+    {"role": "system", "content": "Tu es un assistant."},
+    {"role": "user", "content": "Bonjour"},
+]
+
+@pytest.fixture
+def mock_anthropic():
+    """Fixture pour mocker le client du SDK Anthropic."""
+    with patch.dict('os.environ', {'ANTHROPIC_API_KEY': 'test_key'}), \
+         patch("anthropic.Anthropic") as mock_class:
+        sdk_client = mock_class.return_value
+        sdk_client.with_options.return_value = sdk_client
+        sdk_client.messages.create.return_value.content = [MagicMock(text="Bonjour !")]
+        yield sdk_client
+
+def test_get_chat_completion_success(mock_anthropic):
+    """Teste que le message système est séparé et que le SDK garde ses réglages sans échéance."""
+    assert ClaudeClient().get_chat_completion(MESSAGES) == "Bonjour !"
+    kwargs = mock_anthropic.messages.create.call_args.kwargs
+    assert kwargs["system"] == "Tu es un assistant."
+    assert kwargs["messages"] == MESSAGES[1:]
+    mock_anthropic.with_options.assert_not_called()
+
+def test_deadline_sets_timeout_without_retries(mock_anthropic):
+    """Teste que l'échéance devient le délai de l'appel et désactive les nouvelles tentatives."""
+    ClaudeClient().get_chat_completion(MESSAGES, deadline=Deadline.after(5))
+    kwargs = mock_anthropic.with_options.call_args.kwargs
+    assert 0 < kwargs["timeout"] <= 5
+    assert kwargs["max_retries"] == 0
+
+def test_deadline_exceeded_during_call(mock_anthropic):
+    """Teste qu'un appel interrompu par l'échéance lève DeadlineExceeded."""
+    def slow_call(**kwargs):
+        time.sleep(0.06)
+        raise TimeoutError("trop long")
+    mock_anthropic.messages.create.side_effect = slow_call
+
+    with pytest.raises(DeadlineExceeded, match="appel Claude"):
+        ClaudeClient().get_chat_completion(MESSAGES, deadline=Deadline.after(0.05))
+
+def test_api_error(mock_anthropic):
+    """Teste qu'une erreur de l'API lève AIClientError au lieu de renvoyer un message d'excuse."""
+    mock_anthropic.messages.create.side_effect = RuntimeError("Erreur serveur")
+    with pytest.raises(AIClientError, match="Claude"):
+        ClaudeClient().get_chat_completion(MESSAGES)
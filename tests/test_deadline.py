@@ -0,0 +1,23 @@
+import pytest
+from src.application.deadline import Deadline, DeadlineExceeded
+
+def test_remaining_budget():
+    """Teste que le budget restant décroît sans devenir négatif."""
+    deadline = Deadline.after(10)
+    assert 9 < deadline.remaining() <= 10
+    assert not deadline.expired()
+    assert Deadline.after(-1).remaining() == 0.0
+
+def test_check_expired():
+    """Teste que check lève DeadlineExceeded avec l'étape concernée."""
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        Deadline.after(0).check("extraction PDF")
+    assert exc_info.value.stage == "extraction PDF"
+    assert isinstance(exc_info.value, TimeoutError)
+
+def test_timeout_capped():
+    """Teste que timeout retourne le budget restant, plafonné par la limite de l'étape."""
+    assert Deadline.after(100).timeout("appel", cap=10) == 10
+    assert Deadline.after(5).timeout("appel", cap=10) <= 5
+    with pytest.raises(DeadlineExceeded):
+        Deadline.after(0).timeout("appel", cap=10)
@@ -0,0 +1,51 @@
+import time
+
+import pytest
+from unittest.mock import patch
+from src.application.deadline import Deadline, DeadlineExceeded
+from src.application.ports.ai_client import AIClientError
+from src.infrastructure.gemini_client import GeminiClient
+
+MESSAGES = [
+    {"role": "system", "content": "Tu es un assistant."},
+    {"role": "user", "content": "Bonjour"},
+]
+
+@pytest.fixture
+def mock_chat_session():
+    """Fixture pour mocker la session de chat du SDK Gemini."""
+    with patch.dict('os.environ', {'GOOGLE_API_KEY': 'test_key'}), \
+         patch("google.generativeai.configure"), \
+         patch("google.generativeai.GenerativeModel") as mock_model:
+        chat_session = mock_model.return_value.start_chat.return_value
+        chat_session.send_message.return_value.text = "Bonjour !"
+        yield chat_session
+
+def test_get_chat_completion_success(mock_chat_session):
+    """Teste l'envoi du dernier message sans options de requête en l'absence d'échéance."""
+    assert GeminiClient().get_chat_completion(MESSAGES) == "Bonjour !"
+    args, kwargs = mock_chat_session.send_message.call_args
+    assert args[0] == ["Bonjour"]
+    assert kwargs["request_options"] is None
+
+def test_deadline_sets_request_timeout(mock_chat_session):
+    """Teste que le budget restant est transmis comme délai de la requête."""
+    GeminiClient().get_chat_completion(MESSAGES, deadline=Deadline.after(5))
+    timeout = mock_chat_session.send_message.call_args.kwargs["request_options"]["timeout"]
+    assert 0 < timeout <= 5
+
+def test_deadline_exceeded_during_call(mock_chat_session):
+    """Teste qu'un appel interrompu par l'échéance lève DeadlineExceeded."""
+    def slow_call(*args, **kwargs):
+        time.sleep(0.06)
+        raise TimeoutError("trop long")
+    mock_chat_session.send_message.side_effect = slow_call
+
+    with pytest.raises(DeadlineExceeded, match="appel Gemini"):
+        GeminiClient().get_chat_completion(MESSAGES, deadline=Deadline.after(0.05))
+
+def test_api_error(mock_chat_session):
+    """Teste qu'une erreur de l'API lève AIClientError au lieu de renvoyer un message d'excuse."""
+    mock_chat_session.send_message.side_effect = RuntimeError("Erreur serveur")
+    with pytest.raises(AIClientError, match="Gemini"):
+        GeminiClient().get_chat_completion(MESSAGES)
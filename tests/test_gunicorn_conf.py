@@ -0,0 +1,33 @@
+import os
+import runpy
+import shutil
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SETTINGS = ("WEB_CONCURRENCY", "GUNICORN_THREADS", "REQUEST_DEADLINE_SECONDS", "GUNICORN_GRACEFUL_TIMEOUT")
+
+@pytest.fixture
+def load_conf(tmp_path, monkeypatch):
+    """Charge une copie de gunicorn.conf.py placée à côté d'un fichier .env donné."""
+    for name in SETTINGS:
+        # setenv puis delenv : monkeypatch supprimera aussi les valeurs posées par load_dotenv.
+        monkeypatch.setenv(name, "")
+        monkeypatch.delenv(name)
+    shutil.copy(os.path.join(ROOT, "gunicorn.conf.py"), tmp_path / "gunicorn.conf.py")
+
+    def load(env_content: str) -> dict:
+        (tmp_path / ".env").write_text(env_content, encoding="utf-8")
+        return runpy.run_path(str(tmp_path / "gunicorn.conf.py"))
+    return load
+
+def test_settings_read_from_dotenv(load_conf):
+    """Teste que les workers et threads définis dans .env sont pris en compte."""
+    conf = load_conf("WEB_CONCURRENCY=7\nGUNICORN_THREADS=9\n")
+    assert conf["workers"] == 7
+    assert conf["threads"] == 9
+
+def test_graceful_timeout_follows_request_deadline(load_conf):
+    """Teste que l'arrêt gracieux couvre l'échéance définie dans .env, plus une marge."""
+    conf = load_conf("REQUEST_DEADLINE_SECONDS=100\n")
+    assert conf["graceful_timeout"] == 115
@@ -0,0 +1,41 @@
+import time
+
+import pytest
+import requests
+from unittest.mock import MagicMock, patch
+from src.application.deadline import Deadline, DeadlineExceeded
+from src.infrastructure.joke_api import get_dad_joke
+
+@pytest.fixture
+def mock_requests_get():
+    """Fixture pour mocker requests.get en utilisant unittest.mock."""
+    with patch("requests.get") as mock_get:
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"joke": "Une blague de test."}
+        mock_get.return_value = mock_response
+        yield mock_get
+
+def test_get_dad_joke(mock_requests_get):
+    """Teste la récupération d'une blague avec le délai par défaut."""
+    assert get_dad_joke() == "Une blague de test."
+    assert mock_requests_get.call_args.kwargs["timeout"] == 10
+
+def test_timeout_uses_remaining_budget(mock_requests_get):
+    """Teste que le délai est limité au budget restant de l'échéance."""
+    get_dad_joke(deadline=Deadline.after(2))
+    assert 0 < mock_requests_get.call_args.kwargs["timeout"] <= 2
+
+def test_deadline_exceeded_during_call(mock_requests_get):
+    """Teste qu'un appel interrompu par l'échéance lève DeadlineExceeded au lieu d'un message d'erreur."""
+    def slow_call(*args, **kwargs):
+        time.sleep(0.06)
+        raise requests.exceptions.Timeout("trop long")
+    mock_requests_get.side_effect = slow_call
+
+    with pytest.raises(DeadlineExceeded, match="API de blagues"):
+        get_dad_joke(deadline=Deadline.after(0.05))
+
+def test_error_without_deadline(mock_requests_get):
+    """Teste qu'une erreur sans échéance dépassée renvoie toujours un message d'erreur."""
+    mock_requests_get.side_effect = requests.exceptions.ConnectionError("hors ligne")
+    assert get_dad_joke(deadline=Deadline.after(10)).startswith("Erreur lors de la récupération de la blague")
@@ -1,12 +1,14 @@
 import pytest
 import requests
 from unittest.mock import MagicMock, patch
+from src.application.deadline import Deadline, DeadlineExceeded
+from src.application.ports.ai_client import AIClientError
 from src.infrastructure.openai_client import OpenAIClient
 
 @pytest.fixture
 def mock_requests_post():
-    """Fixture pour mocker requests.post en utilisant unittest.mock."""
-    with patch("requests.post") as mock_post:
+    """Fixture pour mocker requests.Session.post en utilisant unittest.mock."""
+    with patch("requests.Session.post") as mock_post:
         mock_response = MagicMock()
         mock_response.status_code = 200
         mock_response.json.return_value = {
@@ -43,6 +45,22 @@ def test_api_error(mock_requests_post):
         mock_requests_post.side_effect = requests.exceptions.HTTPError("Erreur serveur")
         
         client = OpenAIClient()
-        response = client.get_chat_completion("un prompt")
+        with pytest.raises(AIClientError, match="OpenAI"):
+            client.get_chat_completion("un prompt")
 
-        assert response is None 
\ No newline at end of file
+def test_timeout_uses_remaining_budget(mock_requests_post):
+    """Teste que le délai de l'appel HTTP est limité au budget restant de l'échéance."""
+    with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+        client = OpenAIClient()
+        client.get_chat_completion("un prompt", deadline=Deadline.after(5))
+
+        _, kwargs = mock_requests_post.call_args
+        assert 0 < kwargs["timeout"] <= 5
+
+def test_deadline_exceeded(mock_requests_post):
+    """Teste qu'une échéance dépassée lève DeadlineExceeded sans appeler l'API."""
+    with patch.dict('os.environ', {'OPENAI_API_KEY': 'test_key'}):
+        client = OpenAIClient()
+        with pytest.raises(DeadlineExceeded):
+            client.get_chat_completion("un prompt", deadline=Deadline.after(0))
+        mock_requests_post.assert_not_called()
@@ -0,0 +1,38 @@
+import fitz
+import pytest
+from unittest.mock import MagicMock, patch
+from src.application.deadline import Deadline, DeadlineExceeded
+from src.infrastructure.pdf_processor import PyMuPDFProcessor
+
+def make_pdf(pages):
+    """Construit un PDF en mémoire dont chaque page contient le texte donné."""
+    with fitz.open() as doc:
+        for text in pages:
+            page = doc.new_page()
+            page.insert_text((72, 72), text)
+        return doc.tobytes()
+
+def test_extract_text_from_pdf():
+    """Teste l'extraction du texte de toutes les pages."""
+    text = PyMuPDFProcessor().extract_text_from_pdf(make_pdf(["Page un", "Page deux"]))
+    assert "Page un" in text and "Page deux" in text
+
+def test_extract_invalid_pdf():
+    """Teste qu'un contenu invalide renvoie un message d'erreur."""
+    assert PyMuPDFProcessor().extract_text_from_pdf(b"pas un pdf") == "Impossible d'extraire le contenu de ce PDF."
+
+def test_warm_up():
+    """Teste que le préchauffage s'exécute sans erreur et sans effet sur l'extraction."""
+    processor = PyMuPDFProcessor()
+    processor.warm_up()
+    assert "Bonjour" in processor.extract_text_from_pdf(make_pdf(["Bonjour"]))
+
+def test_extract_stops_at_deadline():
+    """Teste que l'extraction s'arrête entre deux pages une fois l'échéance dépassée."""
+    deadline = MagicMock(spec=Deadline)
+    deadline.check.side_effect = [None, DeadlineExceeded("extraction PDF")]
+
+    with patch.object(fitz.Page, "get_text", return_value="texte") as mock_get_text:
+        with pytest.raises(DeadlineExceeded, match="extraction PDF"):
+            PyMuPDFProcessor().extract_text_from_pdf(make_pdf(["un", "deux", "trois"]), deadline=deadline)
+    assert mock_get_text.call_count == 1
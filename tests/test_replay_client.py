@@ -0,0 +1,105 @@
+import os
+import time
+
+import pytest
+from unittest.mock import MagicMock, patch
+from src.application.deadline import Deadline, DeadlineExceeded
+from src.application.ports.ai_client import AIClientError
+from src.infrastructure.replay_client import ReplayAIClient, ReplayMissError
+
+MESSAGES = [
+    {"role": "system", "content": "Tu es un assistant."},
+    {"role": "user", "content": "Bonjour"},
+]
+
+@pytest.fixture
+def cassette(tmp_path):
+    """Chemin d'une cassette vide dans un répertoire temporaire."""
+    return str(tmp_path / "cassette.jsonl")
+
+def test_record_then_replay(cassette):
+    """Une réponse enregistrée est rejouée sans appeler de client réel."""
+    inner = MagicMock(spec=["get_chat_completion"])
+    inner.get_chat_completion.return_value = "Bonjour !"
+    recorder = ReplayAIClient(cassette_path=cassette, mode="record", inner=inner)
+    assert recorder.get_chat_completion(MESSAGES, model="gpt-3.5-turbo") == "Bonjour !"
+    inner.get_chat_completion.assert_called_once()
+
+    player = ReplayAIClient(cassette_path=cassette, mode="replay", speed=0)
+    assert player.get_chat_completion(MESSAGES, model="gpt-3.5-turbo") == "Bonjour !"
+
+def test_record_skips_known_requests(cassette):
+    """Une requête déjà enregistrée est rejouée sans nouvel appel au client réel."""
+    inner = MagicMock(spec=["get_chat_completion"])
+    inner.get_chat_completion.return_value = "Bonjour !"
+    recorder = ReplayAIClient(cassette_path=cassette, mode="record", inner=inner, speed=0)
+    for _ in range(3):
+        assert recorder.get_chat_completion(MESSAGES, model="gpt-3.5-turbo") == "Bonjour !"
+
+    inner.get_chat_completion.assert_called_once()
+    with open(cassette, encoding="utf-8") as f:
+        assert len(f.readlines()) == 1
+
+def test_record_skips_failed_calls(cassette):
+    """Un appel en échec n'est pas enregistré et sera retenté au prochain enregistrement."""
+    inner = MagicMock(spec=["get_chat_completion"])
+    inner.get_chat_completion.side_effect = AIClientError("OpenAI", "Connexion refusée")
+    recorder = ReplayAIClient(cassette_path=cassette, mode="record", inner=inner)
+    with pytest.raises(AIClientError):
+        recorder.get_chat_completion(MESSAGES, model="gpt-3.5-turbo")
+    assert not os.path.exists(cassette)
+
+    inner.get_chat_completion.side_effect = None
+    inner.get_chat_completion.return_value = "Bonjour !"
+    recorder = ReplayAIClient(cassette_path=cassette, mode="record", inner=inner)
+    assert recorder.get_chat_completion(MESSAGES, model="gpt-3.5-turbo") == "Bonjour !"
+    assert inner.get_chat_completion.call_count == 2
+    with open(cassette, encoding="utf-8") as f:
+        assert len(f.readlines()) == 1
+
+def test_record_streamed_chunks(cassette):
+    """Les fragments d'un client en streaming sont enregistrés et rejoués dans l'ordre."""
+    inner = MagicMock()
+    inner.stream_chat_completion.return_value = iter(["Bon", "jour", " !"])
+    recorder = ReplayAIClient(cassette_path=cassette, mode="record", inner=inner)
+    assert list(recorder.stream_chat_completion(MESSAGES, model="gpt-4o")) == ["Bon", "jour", " !"]
+
+    player = ReplayAIClient(cassette_path=cassette, mode="replay", speed=0)
+    assert list(player.stream_chat_completion(MESSAGES, model="gpt-4o")) == ["Bon", "jour", " !"]
+
+def test_replay_timing(cassette):
+    """Le rejeu respecte le minutage enregistré, divisé par le facteur de vitesse."""
+    with open(cassette, "w", encoding="utf-8") as f:
+        key = ReplayAIClient.request_key(MESSAGES, "gpt-3.5-turbo")
+        f.write(f'{{"key": "{key}", "model": "gpt-3.5-turbo", "chunks": [[0.4, "Bonjour"]]}}\n')
+
+    player = ReplayAIClient(cassette_path=cassette, mode="replay", speed=4)
+    with patch("src.infrastructure.replay_client.time.sleep") as mock_sleep:
+        player.get_chat_completion(MESSAGES, model="gpt-3.5-turbo")
+
+    mock_sleep.assert_called_once()
+    assert 0.09 <= mock_sleep.call_args[0][0] <= 0.1
+
+def test_replay_stops_at_deadline(cassette):
+    """Le rejeu s'interrompt à l'échéance au lieu d'attendre le fragment suivant."""
+    with open(cassette, "w", encoding="utf-8") as f:
+        key = ReplayAIClient.request_key(MESSAGES, "gpt-3.5-turbo")
+        f.write(f'{{"key": "{key}", "model": "gpt-3.5-turbo", "chunks": [[0.0, "Bon"], [5.0, "jour"]]}}\n')
+
+    player = ReplayAIClient(cassette_path=cassette, mode="replay", speed=1)
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        player.get_chat_completion(MESSAGES, model="gpt-3.5-turbo", deadline=Deadline.after(0.1))
+    assert time.monotonic() - start < 1
+
+def test_replay_miss(cassette):
+    """Une requête absente de la cassette lève une erreur explicite."""
+    player = ReplayAIClient(cassette_path=cassette, mode="replay", speed=0)
+    with pytest.raises(ReplayMissError):
+        player.get_chat_completion(MESSAGES, model="gpt-3.5-turbo")
+
+def test_init_no_cassette(monkeypatch):
+    """Teste que l'initialisation échoue si aucune cassette n'est configurée."""
+    monkeypatch.delenv("REPLAY_CASSETTE", raising=False)
+    with pytest.raises(ValueError, match="REPLAY_CASSETTE"):
+        ReplayAIClient()
@@ -0,0 +1,24 @@
+import importlib
+import sys
+
+import pytest
+
+@pytest.fixture
+def fresh_wsgi():
+    """Force la réimportation du module wsgi à chaque test."""
+    sys.modules.pop("wsgi", None)
+    yield
+    sys.modules.pop("wsgi", None)
+
+def test_wsgi_requires_secret_key(fresh_wsgi, monkeypatch):
+    """Teste que le point d'entrée de production refuse de démarrer sans FLASK_SECRET_KEY."""
+    monkeypatch.delenv("FLASK_SECRET_KEY", raising=False)
+    with pytest.raises(RuntimeError, match="FLASK_SECRET_KEY"):
+        importlib.import_module("wsgi")
+
+def test_wsgi_loads_with_secret_key(fresh_wsgi, monkeypatch):
+    """Teste que le point d'entrée se charge lorsque la clé est définie."""
+    monkeypatch.setenv("FLASK_SECRET_KEY", "test_secret")
+    wsgi = importlib.import_module("wsgi")
+    assert wsgi.app is not None
+    assert callable(wsgi.warm_up)
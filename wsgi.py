@@ -0,0 +1,26 @@
+"""
+Point d'entrée WSGI de production.
+
+Ce module est chargé une seule fois par le processus maître du serveur prefork
+(Gunicorn avec `preload_app = True`) avant la création des workers : tout ce qui
+est préparé ici est partagé en copy-on-write entre les workers. Les ressources
+propres à chaque worker (clients IA, connexions) sont créées par `warm_up()`,
+appelé depuis le hook `post_fork` de `gunicorn.conf.py`.
+
+Lancement :
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+import os
+
+from app import app, warm_up
+
+if not os.getenv("FLASK_SECRET_KEY"):
+    raise RuntimeError(
+        "FLASK_SECRET_KEY doit être définie en production : sans clé stable, "
+        "chaque worker signe les sessions avec sa propre clé."
+    )
+
+# Compile le template principal avant le fork pour que les workers en héritent.
+app.jinja_env.get_template("index.html")
+
+__all__ = ["app", "warm_up"]